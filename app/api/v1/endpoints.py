@@ -1,8 +1,15 @@
 """API v1 endpoints implementation"""
 
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.background import BackgroundTask
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.services.conversion_pipeline import conversion_pipeline
 from app.services.file_validation import validate_upload_file
@@ -14,6 +21,69 @@ logger = get_logger(__name__)
 # Create router for endpoints
 router = APIRouter()
 
+# Suffix appended to converted archive downloads
+CONVERTED_SUFFIX = "_converted.zip"
+
+
+def _build_download_response(output_zip_path: Path, safe_filename: str) -> FileResponse:
+    """
+    Move the converted ZIP out of the workspace and build its download response
+
+    The ZIP is relocated (a same-filesystem rename) so it survives workspace
+    cleanup, streamed from disk by FileResponse, and removed by a background
+    task once the response has been sent. Path.stem handles filenames that
+    don't end in .zip.
+    """
+    zip_filename = f"{Path(safe_filename).stem}{CONVERTED_SUFFIX}"
+    output_dir = Path(
+        tempfile.mkdtemp(
+            prefix=f"{settings.workspace_prefix}-out-",
+            dir=settings.workspace_base_path,
+        )
+    )
+    final_zip_path = output_dir / zip_filename
+    shutil.move(str(output_zip_path), final_zip_path)
+
+    return FileResponse(
+        path=final_zip_path,
+        media_type="application/zip",
+        filename=zip_filename,
+        background=BackgroundTask(shutil.rmtree, output_dir, ignore_errors=True),
+    )
+
+
+def _raise_conversion_error(
+    conversion_error: Exception, upload_filename: str | None, workspace_str: str
+) -> None:
+    """Log a pipeline failure and raise the matching HTTPException"""
+    error_message = str(conversion_error)
+
+    # Check if it's a Swift CLI error
+    if "Conversion failed:" in error_message:
+        # Extract CLI stderr for detailed error reporting
+        cli_stderr = error_message.replace("Conversion failed: ", "")
+        logger.error(
+            "Swift CLI conversion failed",
+            extra={
+                "upload_filename": upload_filename,
+                "workspace_path": workspace_str,
+                "cli_stderr": cli_stderr,
+                "full_error": error_message,
+            },
+        )
+        raise HTTPException(status_code=500, detail=f"Conversion failed: {cli_stderr}")
+
+    # Other conversion errors
+    logger.error(
+        "Conversion pipeline failed",
+        extra={
+            "upload_filename": upload_filename,
+            "workspace_path": workspace_str,
+            "error": error_message,
+        },
+    )
+    raise HTTPException(status_code=500, detail=f"Conversion failed: {error_message}")
+
 
 @router.get("/health")
 async def health_check(
@@ -62,7 +132,7 @@ async def health_check(
             },
         )
 
-        return JSONResponse(status_code=200, content=health_status)
+        return ORJSONResponse(status_code=200, content=health_status)
 
     except Exception as e:
         logger.error(
@@ -83,8 +153,8 @@ async def convert_file(file: UploadFile = File(...)):
         file: The DocC archive file to convert
 
     Returns:
-        StreamingResponse: ZIP file containing converted Markdown content
-        JSONResponse: Error response with details
+        FileResponse: ZIP file containing converted Markdown content
+        ORJSONResponse: Error response with details
 
     Raises:
         HTTPException: For validation errors or processing failures
@@ -108,34 +178,33 @@ async def convert_file(file: UploadFile = File(...)):
         - 500: Conversion failed (includes CLI stderr for debugging)
     """
     async with workspace_manager.create_workspace() as workspace:
-        try:
-            logger.info(
-                "File upload received",
-                extra={
-                    "upload_filename": file.filename,
-                    "content_type": file.content_type,
-                    "workspace_path": str(workspace),
-                },
-            )
-
-            # Validate the uploaded file
-            content, safe_filename = await validate_upload_file(file)
+        # Stringify once per request; the path shows up in several log records
+        workspace_str = str(workspace)
 
-            # Store the file in the workspace
-            file_path = workspace_manager.get_file_path(workspace, safe_filename)
-
-            with open(file_path, "wb") as f:
-                f.write(content)
+        try:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "File upload received",
+                    extra={
+                        "upload_filename": file.filename,
+                        "content_type": file.content_type,
+                        "workspace_path": workspace_str,
+                    },
+                )
 
-            logger.info(
-                "File stored in workspace",
-                extra={
-                    "safe_filename": safe_filename,
-                    "file_path": str(file_path),
-                    "file_size": len(content),
-                    "workspace_path": str(workspace),
-                },
-            )
+            # Validate the uploaded file, streaming it directly into the workspace
+            file_path, safe_filename = await validate_upload_file(file, workspace)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "File stored in workspace",
+                    extra={
+                        "safe_filename": safe_filename,
+                        "file_path": str(file_path),
+                        "file_size": file_path.stat().st_size,
+                        "workspace_path": workspace_str,
+                    },
+                )
 
             # Run complete conversion pipeline
             try:
@@ -143,52 +212,12 @@ async def convert_file(file: UploadFile = File(...)):
                     input_zip_path=file_path, workspace=workspace
                 )
 
-                # Read the ZIP content before workspace cleanup
-                with open(output_zip_path, "rb") as zip_file:
-                    zip_content = zip_file.read()
-
-                # Create streaming response with ZIP content
-                zip_filename = safe_filename.replace(".zip", "_converted.zip")
-
-                from fastapi.responses import Response
-
-                return Response(
-                    content=zip_content,
-                    media_type="application/zip",
-                    headers={"Content-Disposition": f'attachment; filename="{zip_filename}"'},
-                )
+                return _build_download_response(output_zip_path, safe_filename)
 
+            except HTTPException:
+                raise
             except Exception as conversion_error:
-                # Handle conversion errors gracefully
-                error_message = str(conversion_error)
-
-                # Check if it's a Swift CLI error
-                if "Conversion failed:" in error_message:
-                    # Extract CLI stderr for detailed error reporting
-                    cli_stderr = error_message.replace("Conversion failed: ", "")
-                    logger.error(
-                        "Swift CLI conversion failed",
-                        extra={
-                            "upload_filename": file.filename,
-                            "workspace_path": str(workspace),
-                            "cli_stderr": cli_stderr,
-                            "full_error": error_message,
-                        },
-                    )
-                    raise HTTPException(status_code=500, detail=f"Conversion failed: {cli_stderr}")
-                else:
-                    # Other conversion errors
-                    logger.error(
-                        "Conversion pipeline failed",
-                        extra={
-                            "upload_filename": file.filename,
-                            "workspace_path": str(workspace),
-                            "error": error_message,
-                        },
-                    )
-                    raise HTTPException(
-                        status_code=500, detail=f"Conversion failed: {error_message}"
-                    )
+                _raise_conversion_error(conversion_error, file.filename, workspace_str)
 
         except HTTPException:
             # Re-raise HTTP exceptions (validation errors, conversion errors)
@@ -198,7 +227,7 @@ async def convert_file(file: UploadFile = File(...)):
                 "Unexpected error in convert endpoint",
                 extra={
                     "upload_filename": file.filename,
-                    "workspace_path": str(workspace),
+                    "workspace_path": workspace_str,
                     "error": str(e),
                 },
             )
@@ -1,7 +1,35 @@
 """Configuration management using Pydantic Settings"""
 
+import os
+import shutil
+from functools import lru_cache
+
+from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Minimum tmpfs capacity required before preferring it for workspaces
+_MIN_TMPFS_BYTES = 1 << 30  # 1 GiB
+
+
+def _default_workspace_base() -> str:
+    """
+    Prefer a RAM-backed tmpfs mount for short-lived conversion workspaces
+
+    Workspace contents (upload, extracted files, output ZIP) live for seconds
+    before deletion, so writing them to disk is wasted I/O. Fall back to /tmp
+    when /dev/shm is missing or too small.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm):
+        try:
+            if shutil.disk_usage(shm).total >= _MIN_TMPFS_BYTES:
+                base = os.path.join(shm, "swift-conv")
+                os.makedirs(base, exist_ok=True)
+                return base
+        except OSError:
+            pass
+    return "/tmp"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
@@ -10,12 +38,18 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
 
+    # Uvicorn Configuration
+    uvicorn_loop: str = "uvloop"  # Event loop implementation (uvloop, asyncio)
+    uvicorn_http: str = "httptools"  # HTTP protocol parser (httptools, h11)
+    uvicorn_workers: int = os.cpu_count() or 2  # Worker process count
+    limit_concurrency: int = 1000  # Maximum concurrent connections per worker
+
     # File Upload Configuration
     max_upload_size_mb: int = 100  # Maximum upload size in MB
     max_decompressed_size_mb: int = 500  # Maximum decompressed size in MB
 
     # Workspace Configuration
-    workspace_base_path: str = "/tmp"  # Base path for workspaces
+    workspace_base_path: str = _default_workspace_base()  # Base path for workspaces
     workspace_prefix: str = "swift-conv"  # Prefix for workspace directories
     workspace_permissions: int = 0o700  # Directory permissions (octal)
 
@@ -23,6 +57,14 @@ class Settings(BaseSettings):
     swift_cli_path: str = "docc2context"  # Path to Swift CLI binary
     subprocess_timeout: int = 60  # Default timeout in seconds
     max_subprocess_retries: int = 3  # Maximum retry attempts
+    max_parallel_conversions: int = os.cpu_count() or 2  # Concurrent Swift CLI processes
+
+    # Redis Configuration
+    redis_url: str = "redis://localhost:6379"  # Rate limiter / shared cache backend
+    redis_max_connections: int = 32  # Connection pool upper bound
+
+    # Health Check Configuration
+    health_cache_ttl_s: float = 1.0  # TTL for cached health status in seconds
 
     # Logging
     log_level: str = "INFO"
@@ -41,9 +83,32 @@ class Settings(BaseSettings):
     rate_limit: int = 100  # Maximum requests per minute per IP
 
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+        validate_default=False,
     )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def max_upload_size_bytes(self) -> int:
+        """Upload size limit in bytes"""
+        return self.max_upload_size_mb * 1024 * 1024
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def max_decompressed_size_bytes(self) -> int:
+        """Decompressed size limit in bytes"""
+        return self.max_decompressed_size_mb * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached Settings instance (one .env parse per process)"""
+    return Settings()
+
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 class ConversionPipeline:
     """Manages the conversion of DocC archives to context format"""
 
+    __slots__ = ("subprocess_manager",)
+
     def __init__(self):
         self.subprocess_manager = SubprocessManager()
 
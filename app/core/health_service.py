@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 class HealthService:
     """Monitors and reports application health status"""
 
+    __slots__ = ()
+
     def check_health(self, force_failure: bool = False) -> dict:
         """
         Check the health of the application.
@@ -1,15 +1,20 @@
 """Structured JSON logging with request ID support"""
 
 import logging
+import secrets
 import sys
-import uuid
 from contextvars import ContextVar
+from datetime import datetime, timezone
 
-from pythonjsonlogger import jsonlogger
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable to store request ID
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 
+# Standard LogRecord attributes that are not user-supplied extra fields
+_RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
 
 def get_request_id() -> str:
     """Get the current request ID from context"""
@@ -17,44 +22,144 @@ def get_request_id() -> str:
 
 
 def set_request_id(request_id: str | None = None) -> str:
-    """Set a request ID in context. If None, generates a new UUID."""
+    """Set a request ID in context. If None, generates a new random hex ID."""
     if request_id is None:
-        request_id = str(uuid.uuid4())
+        # token_hex skips UUID object construction and hyphen formatting;
+        # request IDs only need to be unique, not RFC 4122 UUIDs
+        request_id = secrets.token_hex(16)
     request_id_var.set(request_id)
     return request_id
 
 
+class OrjsonFormatter(logging.Formatter):
+    """JSON log formatter backed by orjson's C-level encoder"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", ""),
+        }
+
+        # Carry over structured fields passed via extra={...}
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and key not in payload:
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        return orjson.dumps(payload, default=str, option=orjson.OPT_UTC_Z).decode()
+
+
 class RequestIDFilter(logging.Filter):
-    """Logging filter to add request ID to log records"""
+    """Logging filter to add request ID to log records
+
+    Kept for backward compatibility; setup_logging now stamps request IDs
+    via a LogRecord factory instead of wiring this filter.
+    """
 
     def filter(self, record: logging.LogRecord) -> bool:
-        # Only add request_id if it doesn't already exist
-        if not hasattr(record, "request_id"):
-            record.request_id = get_request_id()
+        # Only add request_id if it doesn't already exist; checking __dict__
+        # directly avoids hasattr's attribute-protocol walk per record
+        if "request_id" not in record.__dict__:
+            record.request_id = request_id_var.get()
         return True
 
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Configure structured JSON logging"""
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware that assigns a request ID per request
+
+    Sets the ID in the logging contextvar (so every log record emitted while
+    handling the request carries it) and echoes it back in the X-Request-ID
+    response header. Implemented against the raw ASGI protocol like
+    SecurityMiddleware — no BaseHTTPMiddleware task spawn or response
+    buffering per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = set_request_id()
+        header = (b"x-request-id", request_id.encode())
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message["headers"], header]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _install_record_factory() -> None:
+    """Stamp request IDs during LogRecord construction
+
+    A record factory runs once per record inside logging's C-assisted
+    creation path, replacing the per-handler filter call (an extra Python
+    frame plus attribute check per record).
+    """
+    old_factory = logging.getLogRecordFactory()
+
+    def factory(*args, **kwargs) -> logging.LogRecord:
+        record = old_factory(*args, **kwargs)
+        record.request_id = request_id_var.get()
+        return record
+
+    logging.setLogRecordFactory(factory)
+
+
+# Precomputed level-name resolution, avoiding getattr on the logging module
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
+
+# Tracks whether logging has already been configured for this process
+_configured = False
+
+
+def setup_logging(log_level: str = "INFO", force: bool = False) -> None:
+    """Configure structured JSON logging (idempotent unless force=True)"""
+    global _configured
+    if _configured and not force:
+        return
+    _configured = True
+
+    # The JSON payload carries none of these fields, so skip the thread,
+    # process, and multiprocessing lookups logging performs per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     # Create JSON formatter
-    formatter = jsonlogger.JsonFormatter(
-        "%(timestamp)s %(level)s %(name)s %(message)s %(request_id)s", timestamp=True
-    )
+    formatter = OrjsonFormatter()
 
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    root_logger.setLevel(_LOG_LEVELS.get(log_level.upper(), logging.INFO))
 
     # Remove existing handlers
     root_logger.handlers = []
 
-    # Add console handler with JSON formatter
+    # Add console handler with JSON formatter; request IDs are stamped by
+    # the record factory rather than a per-handler filter
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
-    handler.addFilter(RequestIDFilter())
     root_logger.addHandler(handler)
 
+    _install_record_factory()
+
     # Set levels for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
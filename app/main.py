@@ -1,28 +1,87 @@
 """FastAPI application entry point"""
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import orjson
+import redis.asyncio as aioredis
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1.endpoints import router as endpoints_router
 from app.core.config import settings
-from app.core.logging import get_logger, setup_logging
+from app.core.logging import RequestIDMiddleware, get_logger, setup_logging
 from app.core.security import SecurityMiddleware
 
 # Setup logging
 setup_logging()
 
+# Shared Redis connection pool; the rate limiter (and any future cache or
+# metrics client) reuses these connections instead of opening its own
+_REDIS_POOL = aioredis.ConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+redis_client = aioredis.Redis(connection_pool=_REDIS_POOL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown lifecycle"""
+    logger = get_logger(__name__)
+    logger.info("Application starting up", extra={"app_version": settings.app_version})
+    # Make sure the workspace base exists, e.g. when it points at a tmpfs
+    # subdirectory or was overridden via environment
+    Path(settings.workspace_base_path).mkdir(parents=True, exist_ok=True)
+    # Initialize rate limiter; the import stays lazy so the service still
+    # boots (without rate limiting) when fastapi-limiter is not installed
+    try:
+        from fastapi_limiter import FastAPILimiter  # type: ignore[attr-defined]
+
+        await FastAPILimiter.init(redis_client)
+        logger.info("Rate limiter initialized with Redis")
+    except Exception as e:
+        logger.warning(f"Failed to initialize rate limiter: {str(e)}")
+        # Skip rate limiter initialization if Redis is not available
+
+    yield
+
+    logger.info("Application shutting down")
+    await _REDIS_POOL.disconnect()
+
+
 # Create FastAPI app
 app = FastAPI(
-    title=settings.app_name, description=settings.app_description, version=settings.app_version
+    title=settings.app_name,
+    description=settings.app_description,
+    version=settings.app_version,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add security middleware
 app.add_middleware(SecurityMiddleware)
 
+# Assign a request ID per request for log correlation
+app.add_middleware(RequestIDMiddleware)
+
+# Compress JSON/text responses; application/zip is in the middleware's default
+# content-type exclusions, so the already-compressed /convert download is not
+# recompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -42,67 +101,151 @@ app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.allowed_hosts)
 # Include API routes
 app.include_router(endpoints_router, prefix="/api/v1")
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="app/static"))
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets for a day
 
-# Root endpoint to serve frontend
-@app.get("/")
-async def root():
-    """Serve the frontend application"""
-    return FileResponse("app/static/index.html")
+    Also memoizes lookup_path: the asset set is baked into the image and
+    never changes at runtime, so popular files skip the repeated os.stat
+    per request.
+    """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lookup_path = functools.lru_cache(maxsize=256)(  # type: ignore[method-assign]
+            super().lookup_path
+        )
 
-@app.get("/health")
-async def health():
-    """Basic health check endpoint"""
-    return {"status": "healthy", "message": "DocC2Context Service is running"}
-
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=86400"
+        return response
 
-@app.middleware("http")
-async def timeout_middleware(request: Request, call_next):
-    """Request timeout middleware"""
-    try:
-        # Set a timeout for the request (e.g., 30 seconds)
-        import asyncio
 
-        response = await asyncio.wait_for(call_next(request), timeout=30.0)
-        return response
-    except asyncio.TimeoutError:
-        from fastapi import HTTPException
+# Mount static files
+app.mount("/static", CachedStaticFiles(directory="app/static"))
 
-        raise HTTPException(status_code=408, detail="Request timeout")
+# The frontend shell is small and immutable for the life of the process;
+# serving it from memory avoids an open()/stat() pair per root request and
+# the ETag lets returning browsers skip the body entirely
+_INDEX_BODY = Path("app/static/index.html").read_bytes()
+_INDEX_ETAG = f'"{hashlib.blake2b(_INDEX_BODY, digest_size=16).hexdigest()}"'
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event"""
-    setup_logging()
-    logger = get_logger(__name__)
-    logger.info("Application starting up", extra={"app_version": settings.app_version})
-    # Initialize rate limiter
-    from fastapi_limiter import FastAPILimiter
+# Root endpoint to serve frontend
+@app.get("/")
+async def root(request: Request):
+    """Serve the frontend application"""
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers={"ETag": _INDEX_ETAG})
+    return Response(
+        content=_INDEX_BODY,
+        media_type="text/html",
+        headers={"ETag": _INDEX_ETAG, "Cache-Control": "no-cache"},
+    )
 
-    try:
-        from redis.asyncio import Redis
 
-        redis = await Redis(host="localhost", port=6379)
-        await FastAPILimiter.init(redis)
-        logger.info("Rate limiter initialized with Redis")
-    except Exception as e:
-        logger.warning(f"Failed to initialize rate limiter: {str(e)}")
-        # Skip rate limiter initialization if Redis is not available
-        pass
+# The liveness payload never changes, so encode it once at import time;
+# probes then cost a memcpy instead of a JSON serialization each
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "message": "DocC2Context Service is running"})
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event"""
-    logger = get_logger(__name__)
-    logger.info("Application shutting down")
+@app.get("/health")
+async def health():
+    """Basic health check endpoint"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Request timeout in seconds
+REQUEST_TIMEOUT_S = 30.0
+
+_TIMEOUT_BODY = orjson.dumps({"detail": "Request timeout"})
+
+
+class TimeoutMiddleware:
+    """
+    Pure ASGI middleware enforcing a per-request deadline
+
+    Registered as a raw ASGI class rather than @app.middleware("http"),
+    which wraps the function in BaseHTTPMiddleware and its per-request task
+    and stream pair. A plain timer handle that cancels the request task is
+    cheaper than asyncio.wait_for, which allocates a wrapping future and an
+    extra task for every request.
+    """
+
+    def __init__(self, app: ASGIApp, timeout: float = REQUEST_TIMEOUT_S) -> None:
+        self.app = app
+        self.timeout = timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        timed_out = False
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        # ASGIApp is typed as returning Awaitable, but every concrete app in
+        # the stack returns a coroutine, which is what create_task needs
+        task: asyncio.Task[None] = loop.create_task(
+            self.app(scope, receive, send_wrapper)  # type: ignore[arg-type]
+        )
+
+        def _on_timeout() -> None:
+            nonlocal timed_out
+            timed_out = True
+            task.cancel()
+
+        handle = loop.call_later(self.timeout, _on_timeout)
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not timed_out:
+                # Upstream cancellation (client disconnect, server shutdown):
+                # propagate it to the request task like wait_for did, so the
+                # conversion doesn't keep running detached
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+                raise
+            # Only answer if the app never got a response on the wire
+            if not response_started:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 408,
+                        "headers": [(b"content-type", b"application/json")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": _TIMEOUT_BODY})
+        finally:
+            handle.cancel()
+
+
+app.add_middleware(TimeoutMiddleware)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.main:app", host=settings.api_host, port=settings.api_port, reload=True)
+    # uvicorn refuses --workers together with --reload, so the worker count
+    # only applies outside development
+    dev_reload = settings.environment == "development"
+    uvicorn.run(
+        "app.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        loop=settings.uvicorn_loop,
+        http=settings.uvicorn_http,
+        limit_concurrency=settings.limit_concurrency,
+        workers=None if dev_reload else settings.uvicorn_workers,
+        reload=dev_reload,
+    )
@@ -1,9 +1,11 @@
 """File validation service for upload security"""
 
-import io
 import os
+import re
 import zipfile
+from pathlib import Path
 
+import aiofiles
 from fastapi import HTTPException, UploadFile
 
 from app.core.config import settings
@@ -18,6 +20,13 @@ ZIP_MAGIC_NUMBERS = [
     b"PK\x07\x08",  # Spanned archive
 ]
 
+# All magic numbers are 4 bytes, so the check is one slice plus one hash
+# lookup rather than a startswith call per candidate
+_ZIP_MAGIC_PREFIXES = frozenset(ZIP_MAGIC_NUMBERS)
+
+# Chunk size for streaming uploads to disk (1 MiB keeps per-request memory bounded)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 # Safe filename characters (alphanumeric, dash, underscore, period, and common DocC characters)
 # DocC archives can contain Swift function signatures and special characters
 SAFE_FILENAME_CHARS = set(
@@ -25,6 +34,10 @@ SAFE_FILENAME_CHARS = set(
 )
 MAX_FILENAME_LENGTH = 255
 
+# Compiled complement of SAFE_FILENAME_CHARS; one C-level regex scan per
+# filename instead of a Python loop with a set probe per character
+_UNSAFE_CHAR_RE = re.compile(f"[^{re.escape(''.join(sorted(SAFE_FILENAME_CHARS)))}]")
+
 
 class FileValidationError(Exception):
     """Raised when file validation fails"""
@@ -32,9 +45,15 @@ class FileValidationError(Exception):
     pass
 
 
+class FileSizeError(FileValidationError):
+    """Raised when an upload exceeds the configured size limit"""
+
+    pass
+
+
 def validate_file_size(file_size: int) -> None:
     """Validate file size against configured limits"""
-    max_size = settings.max_upload_size_mb * 1024 * 1024  # Convert MB to bytes
+    max_size = settings.max_upload_size_bytes
 
     if file_size > max_size:
         logger.warning(
@@ -46,7 +65,7 @@ def validate_file_size(file_size: int) -> None:
                 "limit_mb": settings.max_upload_size_mb,
             },
         )
-        raise FileValidationError(
+        raise FileSizeError(
             f"File size {file_size / (1024 * 1024):.1f}MB exceeds limit of {settings.max_upload_size_mb}MB"
         )
 
@@ -56,10 +75,8 @@ def validate_zip_magic_number(file_content: bytes) -> None:
     if not file_content:
         raise FileValidationError("Empty file provided")
 
-    # Check first few bytes against ZIP magic numbers
-    is_zip = any(file_content.startswith(magic) for magic in ZIP_MAGIC_NUMBERS)
-
-    if not is_zip:
+    # Check the 4-byte header against the known ZIP magic numbers
+    if file_content[:4] not in _ZIP_MAGIC_PREFIXES:
         logger.warning(
             "Invalid file type - not a ZIP archive",
             extra={
@@ -82,9 +99,9 @@ def sanitize_filename(filename: str) -> str:
     if len(filename) > MAX_FILENAME_LENGTH:
         raise FileValidationError(f"Filename too long: {len(filename)} > {MAX_FILENAME_LENGTH}")
 
-    # Check for safe characters only
-    if not all(c in SAFE_FILENAME_CHARS for c in filename):
-        unsafe_chars = set(filename) - SAFE_FILENAME_CHARS
+    # Check for safe characters only; the findall only runs on rejection
+    if _UNSAFE_CHAR_RE.search(filename):
+        unsafe_chars = set(_UNSAFE_CHAR_RE.findall(filename))
         logger.warning(
             "Filename contains unsafe characters",
             extra={"original_filename": filename, "unsafe_chars": list(unsafe_chars)},
@@ -122,7 +139,7 @@ def validate_zip_bomb_protection(zip_file: zipfile.ZipFile, original_size: int)
     total_uncompressed_size = 0
     max_decompressed_size = min(
         original_size * 5,  # 5x compression ratio limit
-        settings.max_decompressed_size_mb * 1024 * 1024,  # Hard size limit
+        settings.max_decompressed_size_bytes,  # Hard size limit
     )
 
     file_count = 0
@@ -184,35 +201,52 @@ def validate_zip_bomb_protection(zip_file: zipfile.ZipFile, original_size: int)
     )
 
 
-async def validate_upload_file(file: UploadFile) -> tuple[bytes, str]:
-    """Comprehensive validation of uploaded file"""
-    try:
-        # Read file content for validation
-        content = await file.read()
-        file_size = len(content)
+async def validate_upload_file(file: UploadFile, workspace: Path) -> tuple[Path, str]:
+    """
+    Comprehensive validation of uploaded file, streaming content to disk
 
+    The upload is consumed in fixed-size chunks and written directly into the
+    workspace so peak memory stays bounded regardless of upload size. The size
+    limit and ZIP magic number are enforced incrementally while streaming.
+
+    Args:
+        file: The uploaded file to validate
+        workspace: Workspace directory to store the validated file in
+
+    Returns:
+        Tuple of (path to stored file, sanitized filename)
+    """
+    try:
         logger.info(
             "Starting file validation",
-            extra={
-                "upload_filename": file.filename,
-                "content_type": file.content_type,
-                "file_size": file_size,
-            },
+            extra={"upload_filename": file.filename, "content_type": file.content_type},
         )
 
-        # Step 1: Validate file size
-        validate_file_size(file_size)
+        # Step 1: Sanitize filename
+        safe_filename = sanitize_filename(file.filename or "upload.zip")
+        file_path = workspace / safe_filename
 
-        # Step 2: Validate magic number
-        validate_zip_magic_number(content)
+        # Step 2: Stream content to disk, validating size and magic number incrementally
+        file_size = 0
+        first_chunk = True
 
-        # Step 3: Sanitize filename
-        safe_filename = sanitize_filename(file.filename or "upload.zip")
+        async with aiofiles.open(file_path, "wb") as out_file:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if first_chunk:
+                    validate_zip_magic_number(chunk)
+                    first_chunk = False
+
+                file_size += len(chunk)
+                validate_file_size(file_size)
 
-        # Step 4: Validate ZIP structure and bomb protection
+                await out_file.write(chunk)
+
+        if first_chunk:
+            raise FileValidationError("Empty file provided")
+
+        # Step 3: Validate ZIP structure and bomb protection from the stored file
         try:
-            # Use content bytes instead of file object for ZIP validation
-            with zipfile.ZipFile(io.BytesIO(content), mode="r") as zip_file:
+            with zipfile.ZipFile(file_path, mode="r") as zip_file:
                 validate_zip_bomb_protection(zip_file, file_size)
         except zipfile.BadZipFile as e:
             logger.error(
@@ -221,9 +255,6 @@ async def validate_upload_file(file: UploadFile) -> tuple[bytes, str]:
             )
             raise FileValidationError(f"Invalid ZIP file: {str(e)}")
 
-        # Reset file pointer for further processing
-        await file.seek(0)
-
         logger.info(
             "File validation completed successfully",
             extra={
@@ -233,8 +264,14 @@ async def validate_upload_file(file: UploadFile) -> tuple[bytes, str]:
             },
         )
 
-        return content, safe_filename
+        return file_path, safe_filename
 
+    except FileSizeError as e:
+        logger.warning(
+            "File size validation failed",
+            extra={"upload_filename": file.filename, "error": str(e)},
+        )
+        raise HTTPException(status_code=413, detail=str(e))
     except FileValidationError as e:
         logger.warning(
             "File validation failed", extra={"upload_filename": file.filename, "error": str(e)}
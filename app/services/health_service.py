@@ -1,13 +1,14 @@
 """Health check service for system and binary status monitoring"""
 
 import shutil
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.services.subprocess_manager import subprocess_manager
+from app.services.subprocess_manager import resolved_cli_path, subprocess_manager
 
 logger = get_logger(__name__)
 
@@ -15,8 +16,13 @@ logger = get_logger(__name__)
 class HealthService:
     """Manages health checks for the application"""
 
+    __slots__ = ("workspace_path", "_status_cache")
+
     def __init__(self):
         self.workspace_path = Path(settings.workspace_base_path)
+        # Cache of (monotonic timestamp, response) keyed by include_system_checks;
+        # load balancers probe /health far more often than the status can change
+        self._status_cache: dict[bool, tuple[float, dict[str, Any]]] = {}
 
     async def check_swift_cli(self) -> dict[str, Any]:
         """
@@ -27,6 +33,21 @@ class HealthService:
         """
         logger.info("Checking Swift CLI binary availability")
 
+        # Skip the subprocess spawn (and its retries) entirely when the binary
+        # is not on PATH; the lookup itself is memoized for the process
+        if resolved_cli_path() is None:
+            logger.warning(
+                "Swift CLI binary not found on PATH",
+                extra={"binary_path": settings.swift_cli_path},
+            )
+            return {
+                "status": "error",
+                "binary_detected": False,
+                "binary_path": settings.swift_cli_path,
+                "version": None,
+                "error": f"Binary '{settings.swift_cli_path}' not found on PATH",
+            }
+
         try:
             result = await subprocess_manager.check_swift_binary()
             return {
@@ -190,6 +211,14 @@ class HealthService:
         Returns:
             Complete health status dictionary
         """
+        # Serve from cache within the TTL window so probe storms don't hammer
+        # the Swift CLI binary check and system syscalls
+        cached = self._status_cache.get(include_system_checks)
+        if cached is not None:
+            cached_at, cached_response = cached
+            if time.monotonic() - cached_at < settings.health_cache_ttl_s:
+                return cached_response
+
         logger.info(
             "Generating health status", extra={"include_system_checks": include_system_checks}
         )
@@ -243,6 +272,8 @@ class HealthService:
             },
         )
 
+        self._status_cache[include_system_checks] = (time.monotonic(), response)
+
         return response
 
 
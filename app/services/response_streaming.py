@@ -1,9 +1,11 @@
 """Response streaming service for efficient file delivery"""
 
+import io
 import zipfile
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
+import aiofiles
 from fastapi.responses import StreamingResponse
 
 from app.core.logging import get_logger
@@ -15,11 +17,11 @@ class ResponseStreamer:
     """Handles streaming responses for large files"""
 
     def __init__(self):
-        self.chunk_size = 8192  # 8KB chunks for streaming
+        self.chunk_size = 256 * 1024  # 256KB chunks for streaming
 
     async def stream_file(self, file_path: Path) -> AsyncGenerator[bytes, None]:
         """
-        Stream a file in chunks
+        Stream a file in chunks without blocking the event loop
 
         Args:
             file_path: Path to file to stream
@@ -37,9 +39,9 @@ class ResponseStreamer:
         )
 
         try:
-            with open(file_path, "rb") as file:
+            async with aiofiles.open(file_path, "rb") as file:
                 while True:
-                    chunk = file.read(self.chunk_size)
+                    chunk = await file.read(self.chunk_size)
                     if not chunk:
                         break
                     yield chunk
@@ -81,8 +83,6 @@ class ResponseStreamer:
 
         try:
             # Create ZIP in memory with streaming
-            import io
-
             zip_buffer = io.BytesIO()
 
             with zipfile.ZipFile(zip_buffer, "w", compression) as zip_file:
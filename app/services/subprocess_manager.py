@@ -1,6 +1,8 @@
 """Subprocess management service for Swift CLI execution"""
 
 import asyncio
+import shutil
+from functools import lru_cache
 from pathlib import Path
 
 from app.core.config import settings
@@ -9,9 +11,22 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def resolved_cli_path() -> str | None:
+    """
+    Resolve the Swift CLI binary to an absolute path once per process
+
+    settings.swift_cli_path is static at boot, so the PATH traversal only
+    needs to happen on first use; every later caller gets the cached result.
+    """
+    return shutil.which(settings.swift_cli_path)
+
+
 class SubprocessResult:
     """Result of subprocess execution"""
 
+    __slots__ = ("returncode", "stdout", "stderr", "command", "success")
+
     def __init__(self, returncode: int, stdout: str, stderr: str, command: list[str]):
         self.returncode = returncode
         self.stdout = stdout
@@ -26,11 +41,18 @@ class SubprocessResult:
 class SubprocessManager:
     """Manages subprocess execution with timeout and error handling"""
 
+    __slots__ = ("swift_cli_path", "default_timeout", "max_retries")
+
     def __init__(self):
         self.swift_cli_path = settings.swift_cli_path
         self.default_timeout = settings.subprocess_timeout
         self.max_retries = settings.max_subprocess_retries
 
+    @property
+    def cli_path(self) -> str:
+        """Absolute path to the Swift CLI binary, falling back to the configured name"""
+        return resolved_cli_path() or self.swift_cli_path
+
     async def execute_command(
         self,
         command: list[str],
@@ -192,7 +214,7 @@ class SubprocessManager:
             SubprocessResult: Result of version check
         """
         try:
-            return await self.execute_command([self.swift_cli_path, "--version"])
+            return await self.execute_command([self.cli_path, "--version"])
         except Exception as e:
             logger.error(
                 "Swift CLI binary check failed",
@@ -215,7 +237,7 @@ class SubprocessManager:
         Returns:
             SubprocessResult: Conversion result
         """
-        command = [self.swift_cli_path, str(input_path), str(output_path)]
+        command = [self.cli_path, str(input_path), str(output_path)]
 
         logger.info(
             "Starting DocC to Markdown conversion",
@@ -1,15 +1,18 @@
 """Unit tests for file validation service"""
 
+import io
 import os
 import tempfile
 import zipfile
 
 import pytest
+from fastapi import HTTPException, UploadFile
 
 from app.services.file_validation import (
     FileValidationError,
     sanitize_filename,
     validate_file_size,
+    validate_upload_file,
     validate_zip_bomb_protection,
     validate_zip_magic_number,
 )
@@ -93,3 +96,49 @@ def test_validate_zip_bomb_protection_invalid():
             with pytest.raises(FileValidationError):
                 validate_zip_bomb_protection(zip_file, 1024)
         os.unlink(temp_file.name)
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_file_valid(temp_workspace):
+    """Test streaming validation of a valid ZIP upload"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zipf:
+        zipf.writestr("sample.txt", "This is a sample file.")
+    upload = UploadFile(file=io.BytesIO(buffer.getvalue()), filename="valid_file.zip")
+
+    file_path, safe_filename = await validate_upload_file(upload, temp_workspace)
+
+    assert safe_filename == "valid_file.zip"
+    assert file_path == temp_workspace / "valid_file.zip"
+    assert file_path.read_bytes() == buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_file_oversize(temp_workspace):
+    """Test that an oversize upload is rejected with 413 while streaming"""
+    content = b"PK\x03\x04" + b"0" * (100 * 1024 * 1024)  # limit is 100MB
+    upload = UploadFile(file=io.BytesIO(content), filename="big.zip")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validate_upload_file(upload, temp_workspace)
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_file_invalid_magic(temp_workspace):
+    """Test that a non-ZIP upload is rejected on its first chunk"""
+    upload = UploadFile(file=io.BytesIO(b"This is not a ZIP file."), filename="notzip.zip")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validate_upload_file(upload, temp_workspace)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_file_empty(temp_workspace):
+    """Test that an empty upload is rejected"""
+    upload = UploadFile(file=io.BytesIO(b""), filename="empty.zip")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validate_upload_file(upload, temp_workspace)
+    assert exc_info.value.status_code == 400